@@ -46,6 +46,8 @@ class Constraint:
             inverts type of the constraint (multiplies constraint times -1)
         is_equivalent(other: Constraint, model: Model) -> bool:
             returns true if other constraint is equivalent given the specific model
+        clone() -> Constraint:
+            returns a copy of the constraint with a copied expression
     """
     index: int 
     expression: sseexp.Expression
@@ -71,5 +73,11 @@ class Constraint:
                self.bound == other.bound and \
                self.expression.is_equivalent(other.expression, model)
 
+    def clone(self) -> Constraint:
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.expression = self.expression.clone()
+        return new
+
     def __str__(self):
         return f"{self.expression} {self.type} {self.bound}"
\ No newline at end of file
@@ -1,11 +1,11 @@
 from __future__ import annotations
-from copy import deepcopy
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Tuple
 
 from itertools import groupby
 from functools import reduce
 import saport.simplex.expressions.constraint as ssecon
 import saport.simplex.model as ssmod
+import numpy as np
 
 class Expression:
     """
@@ -27,10 +27,13 @@ class Expression:
             assignment is just a list of values with order corresponding to the variables in the model
         simplified() -> Expression:
             returns a new expression with sorted and atoms and reduced coefficients 
-        coefficients(model: Model) -> list[float]:
-            return list of coefficients corresponding to the variables in the model
+        coefficients(model: Model, out: numpy.Array | None) -> numpy.Array:
+            return array of coefficients corresponding to the variables in the model
+            if `out` is given, the coefficients are written into it and `out` is returned instead
         is_equivalent(other: Expression, model: Model) -> bool:
             returns true if other expression is equivalent given the specific model
+        clone() -> Expression:
+            returns a copy of the expression with its own list of atoms
         __add__(other: Expression) -> Expression:
             returns sum of the two polynomials
         __sub__(other: Expression) -> Expression:
@@ -45,11 +48,22 @@ class Expression:
         __ge__(bound: float) -> Constraint:
             returns a new "greater than or equal" constraint
     """
-    atoms: List[Atom]
+    _atoms: List[Atom]
+    _terms: Optional[Tuple[np.ndarray, np.ndarray]]
 
     def __init__(self, *atoms: Atom):
         self.atoms = atoms 
 
+    @property
+    def atoms(self) -> List[Atom]:
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, atoms: List[Atom]):
+        # the term arrays are derived from the atoms, so they have to be rebuilt
+        self._atoms = atoms
+        self._terms = None
+
     @classmethod
     def from_vectors(self, variables: Iterable[Variable], coefficients: Iterable[float]) -> Expression:
         assert len(variables) == len(coefficients), f"number of coefficients should correspond to variables in the expression"
@@ -70,17 +84,33 @@ class Expression:
  
         self.atoms = [reduce_group(g) for g in grouped_atoms]
         
-    def coefficients(self, model: ssmod.Model) -> List[float]:
-        simplified_expression = deepcopy(self)
-        simplified_expression.simplify()
-        coefficients = [0.0 for _ in model.variables]
-        for a in simplified_expression.atoms:
-            if a.var.index < len(coefficients):
-                coefficients[a.var.index] = a.coefficient
+    def coefficients(self, model: ssmod.Model, out: Optional[np.ndarray] = None) -> np.ndarray:
+        coefficients = np.empty(len(model.variables)) if out is None else out
+        self._write_coefficients(coefficients)
         return coefficients
 
+    def _write_coefficients(self, out: np.ndarray):
+        indices, values = self._term_arrays()
+        in_model = indices < len(out)
+        out.fill(0.0)
+        np.add.at(out, indices[in_model], values[in_model])
+
+    def _term_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        # parallel arrays of variable indices and coefficients, built once from the atoms
+        if self._terms is None:
+            indices = np.fromiter((a.var.index for a in self.atoms), dtype=np.intp, count=len(self.atoms))
+            values = np.fromiter((a.coefficient for a in self.atoms), dtype=np.float64, count=len(self.atoms))
+            self._terms = (indices, values)
+        return self._terms
+
     def is_equivalent(self, other: Expression, model: ssmod.model) -> bool:
-        return self.coefficients(model) == other.coefficients(model)
+        return np.array_equal(self.coefficients(model), other.coefficients(model))
+
+    def clone(self) -> Expression:
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.atoms = list(self.atoms)
+        return new
 
     def __add__(self, other: Expression) -> Expression:
         new_atoms = list(self.atoms)
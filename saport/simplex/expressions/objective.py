@@ -45,6 +45,8 @@ class Objective:
             assignment is just a list of floats corresponding (by index) to the variables in the model 
         is_equivalent(other: Objective, model: Model) -> bool:
             returns true if other objective is equivalent given the specific model
+        clone() -> Objective:
+            returns a copy of the objective with a copied expression
     """
     expression: sseexp.Expression
     type: ObjectiveType
@@ -77,5 +79,11 @@ class Objective:
                self.coefficient == other.coefficient and \
                self.expression.is_equivalent(other.expression, model)
 
+    def clone(self) -> Objective:
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.expression = self.expression.clone()
+        return new
+
     def __str__(self) -> str:
         return f'{self.type}: {self.name()} = {self.expression}'
\ No newline at end of file
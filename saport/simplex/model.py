@@ -37,6 +37,8 @@ class Model:
             sets objective to minimize the specified Expression
         simplify():
             simplifies all the expressions used in the model
+        clone() -> Model
+            returns a structural copy of the model, variables are shared, constraints and objective are copied
         solve() -> Solution
             solves the current model using Simplex solver and returns the result
             when called, the model should already contain at least one variable and objective
@@ -79,6 +81,14 @@ class Model:
         if self.objective is not None:
             self.objective.simplify()
 
+    def clone(self) -> Model:
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.variables = list(self.variables)
+        new.constraints = [c.clone() for c in self.constraints]
+        new.objective = None if self.objective is None else self.objective.clone()
+        return new
+
     def solve(self) -> sssol.Solution:
         if len(self.variables) == 0:
             raise EmptyModelError()
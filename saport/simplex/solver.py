@@ -2,7 +2,6 @@ from __future__ import annotations
 import sys
 from typing import Dict, List
 
-from copy import deepcopy
 import saport.simplex.model as ssmod 
 import saport.simplex.expressions.objective as sseobj
 import saport.simplex.expressions.constraint as ssecon
@@ -42,7 +41,7 @@ class Solver:
         else:
             tableau = self._basic_initial_tableau(normal_model)
         
-        initial_tableau = deepcopy(tableau)
+        initial_tableau = tableau.snapshot()
         if self._optimize(tableau) == False:
             return sssol.Solution.unbounded(model, initial_tableau, tableau)
 
@@ -80,7 +79,7 @@ class Solver:
             _augment_model(model: Model) -> Model:
                 returns an augmented version of the given model 
         """
-        model = deepcopy(original_model)
+        model = original_model.clone()
         model.simplify()
         self._change_objective_to_max(model)
         self._change_constraints_bounds_to_nonnegative(model)
@@ -89,7 +88,7 @@ class Solver:
         return model  
 
     def _create_presolve_model(self, augmented_model: ssmod.Model):
-        presolve_model = deepcopy(augmented_model)
+        presolve_model = augmented_model.clone()
         self._artificial = self._add_artificial_variables(presolve_model)
         return presolve_model    
 
@@ -136,7 +135,7 @@ class Solver:
         #               (constraint class has an `index` attribute, you may use, e.g. c1.index == c2.index)
         artificial_variables: Dict[sseexp.Variable, ssecon.Constraint] = dict()
 
-        with_slack: list[int] = [constraint.index for constraint in self._slacks.values()]
+        with_slack: set[int] = {constraint.index for constraint in self._slacks.values()}
 
         for constraint in model.constraints:
             if constraint.index not in with_slack:
@@ -145,13 +144,24 @@ class Solver:
                 artificial_variables[artificial_var] = constraint
                 
                 constraint.expression += artificial_var
-                model.objective.expression += artificial_var
+
+        # objective is extended once, adding variables one by one would copy its atoms every time
+        model.objective.expression += sseexp.Expression(*artificial_variables)
 
         return artificial_variables
 
+    def _artificial_indices(self) -> np.ndarray:
+        return np.fromiter((v.index for v in self._artificial), dtype=np.intp, count=len(self._artificial))
+
     def _basic_initial_tableau(self, model: ssmod.Model):
-        objective_row = np.array((-1 * model.objective.expression).coefficients(model) + [0.0])
-        table = np.array([objective_row] + [c.expression.coefficients(model) + [c.bound] for c in model.constraints])
+        table = np.empty((len(model.constraints) + 1, len(model.variables) + 1), dtype=np.float64)
+
+        np.subtract(0.0, model.objective.expression.coefficients(model), out=table[0, :-1])
+        table[0, -1] = 0.0
+        for row, c in zip(table[1:], model.constraints):
+            c.expression.coefficients(model, out=row[:-1])
+            row[-1] = c.bound
+
         return sstab.Tableau(model, table)
 
     def _presolve_initial_tableau(self, model: ssmod.Model):
@@ -163,16 +173,17 @@ class Solver:
         tableau: sstab.Tableau = self._basic_initial_tableau(model)
         table = tableau.table
 
+        cols = self._artificial_indices()
+        rows = np.fromiter((c.index + 1 for c in self._artificial.values()), dtype=np.intp)
+
         # 1) Zero the objective row
-        table[0] = 0
+        table[0, :] = 0
         
         # 2) Add coefficient =1 only to artificial variables
-        for variable in self._artificial:
-            table[0, variable.index] = 1        
+        table[0, cols] = 1.0
 
-        # 3) Fixing basis to by R1, R2, ...
-        for constraint_with_artificial in self._artificial.values():
-            table[0] -= table[constraint_with_artificial.index + 1]
+        # 3) Fixing basis to by R1, R2, ... (all rows subtracted at once)
+        table[0] -= table[rows].sum(axis=0)
 
         return sstab.Tableau(model, table)
 
@@ -182,12 +193,9 @@ class Solver:
         #       tip 2. use `tableau.extract_assignment` or `tableau.extract_basis`
         #           - `Variable` class has an `index` attribute, e.g. you may use
         #             `assignment[var.index]` to get value of the variable `var` in the assignment 
-        assignment = tableau.extract_assignment()
-        for var in self._artificial:
-            if assignment[var.index] > 0:
-                return True
-        
-        return False
+        assignment = np.asarray(tableau.extract_assignment())
+        # values within the tableau tolerance are numerical noise left after the pivots, not infeasibility
+        return bool((assignment[self._artificial_indices()] > sstab.eps).any())
 
     def _restore_initial_tableau(self, tableau: sstab.Tableau, model: ssmod.Model):
         # TODO: remove artificial variables from the tableau and restore the objective
@@ -198,17 +206,28 @@ class Solver:
         #          in the first phase tableau also basic in the new tableau
         
         # 1) Delete columns with artificial variables
-        artificial_var_columns = [artificial_var.index for artificial_var in self._artificial]
-        new_table = np.delete(tableau.table, artificial_var_columns, axis=1)
+        #    (`np.compress` makes a single C-ordered copy, the input tableau is left intact)
+        keep_mask = np.ones(tableau.table.shape[1], dtype=bool)
+        keep_mask[self._artificial_indices()] = False
+        new_table = np.compress(keep_mask, tableau.table, axis=1)
 
         # 2) Restore original objective row
-        new_table[0] = np.array((-1 * model.objective.expression).coefficients(model) + [0.0])
-
-        # 3) 
-        columns = np.column_stack(new_table[1:])
-        for i, col in enumerate(columns):
-            if (np.amax(col), np.amin(col)) == (1, 0):
-                new_table[0] -= new_table[0, i] * new_table[np.argmax(col) + 1]
+        np.subtract(0.0, model.objective.expression.coefficients(model), out=new_table[0, :-1])
+        new_table[0, -1] = 0.0
+
+        # 3) Zero the objective coefficients of the basic columns,
+        #    a column is basic if it has exactly one nonzero entry equal to 1
+        sub = new_table[1:, :-1]
+        nnz = np.count_nonzero(sub, axis=0)
+        sums = sub.sum(axis=0)
+        is_basic = (nnz == 1) & (sums == 1.0)
+
+        cols = np.flatnonzero(is_basic)
+        rows = np.argmax(sub[:, cols], axis=0) + 1
+        # identical unit columns may share a row, only the first one is kept in the basis
+        rows, first = np.unique(rows, return_index=True)
+        cols = cols[first]
+        new_table[0] -= (new_table[0, cols][:, None] * new_table[rows]).sum(axis=0)
         
         return sstab.Tableau(tableau.model, new_table)
 
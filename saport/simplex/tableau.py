@@ -2,7 +2,6 @@ from __future__ import annotations
 from typing import List
 from numpy.typing import ArrayLike
 import numpy as np
-import math
 from . import model as ssmod
 
 eps = 0.000000001
@@ -40,6 +39,8 @@ class Tableau:
             returns assignment corresponding to the tableau
         extract_basis() -> List[int]
             returns list of indexes corresponding to the variables belonging to the basis
+        snapshot() -> Tableau
+            returns a tableau sharing the model, with a copy of the table
     """
     model: ssmod.Model
     table: ArrayLike
@@ -64,33 +65,32 @@ class Tableau:
         return self.table[1:, col].max() <= eps 
 
     def choose_leaving_variable(self, col: int) -> int:
-        # List comprehensions magic:
-        # - let's iteratate over the column - `for i,c in enumerate(self.table[:, col])`
-        # - let's consider only positive values: `if c > eps` and ignore the first row as it is objective: `i > 0`
-        # - as the result, let's return a tuple, where:
-        #   * first element is bound divided by the given coefficien: self.table[i,-1] / c
-        #   * second element is index of the row corresponding to the result
-        # Effectively, the `indicators` list contains division results and their corresponding row indices
-        indicators = [(self.table[i,-1] / c, i) for i,c in enumerate(self.table[:, col]) if c > eps and i > 0]
-        
-        # Let't return the minimal element from the list, the correspnding index of the row, to be exact 
-        # - in python when two tuples are compared, e.g. (1,3) and (0, 5) — the comparison is lexicographical:
-        #   we compare elements starting from left, therefore (0, 5) is smaller than (1, 3), as 0 is smaller than 1
-        # - we take care of the scenario when there is no row constraining the variable 
-        #   `a if b else c` is the same as `c ? a : b` in C/C++
-        return min(indicators)[1] if len(indicators) > 0 else None
+        # Ratio test done on whole columns at once:
+        # - we consider only positive coefficients of the column, ignoring the objective row
+        # - bounds of the remaining rows are replaced by `inf`, so they never win the comparison
+        # - `argmin` returns the first minimum, so ties are broken by the smallest row index
+        column = self.table[1:, col]
+        positive = column > eps
+        if not positive.any():
+            return None
+
+        ratios = np.full(column.shape, np.inf)
+        np.divide(self.table[1:, -1], column, out=ratios, where=positive)
+        return int(ratios.argmin()) + 1
 
     def pivot(self, row: int, col: int):
         # First, we normalize to row to have `1` at the pivot coords
         self.table[row] /= self.table[row,col]
 
-        # Then we iterate over all the rows in the table
-        for i,r in enumerate(self.table):
-            # we ignore the pivot row
-            if i == row:
-                continue
-            # we substract pivot row from the row r[col] times
-            r -= r[col] * self.table[row]
+        # Then we substract the pivot row from every other row r[col] times,
+        # it's a single rank-1 update: table -= column ⊗ pivot_row
+        # - the pivot row itself is ignored by zeroing its factor
+        # - only the rows having a nonzero factor are updated,
+        #   constraint matrices are usually sparse, so the remaining rows would not change anyway
+        factors = self.table[:, col].copy()
+        factors[row] = 0.0
+        rows = np.flatnonzero(factors)
+        self.table[rows] -= np.multiply.outer(factors[rows], self.table[row])
 
     def extract_assignment(self) -> List[float]:
         rows_n, cols_n = self.table.shape
@@ -105,17 +105,21 @@ class Tableau:
     def extract_basis(self) -> List[int]:
         rows_n, cols_n = self.table.shape
         basis = [-1 for _ in range(rows_n -1)]
-        for c in range(cols_n - 1):
-            column = self.table[:,c]
-            belongs_to_basis = math.isclose(column.min(), 0.0, abs_tol = eps) \
-                           and math.isclose(column.max(), 1.0, abs_tol = eps) \
-                           and math.isclose(column.sum(), 1.0, abs_tol = eps)
-            if belongs_to_basis:
-                row = np.where(column == 1.0)[0][0]
-                # [row-1] because we ignore the cost variable in the basis
-                basis[row-1] = c
+        # column reductions are computed for all the columns at once, instead of column by column
+        columns = self.table[:, :-1]
+        belongs_to_basis = np.isclose(columns.min(axis=0), 0.0, rtol = 0.0, atol = eps) \
+                         & np.isclose(columns.max(axis=0), 1.0, rtol = 0.0, atol = eps) \
+                         & np.isclose(columns.sum(axis=0), 1.0, rtol = 0.0, atol = eps)
+        cols = np.flatnonzero(belongs_to_basis)
+        rows = columns[:, cols].argmax(axis=0)
+        for c, row in zip(cols, rows):
+            # [row-1] because we ignore the cost variable in the basis
+            basis[row-1] = int(c)
         return basis
 
+    def snapshot(self) -> Tableau:
+        return Tableau(self.model, self.table.copy())
+
     def __str__(self) -> str:
         def cell(x: float, w: int) -> str:
             return '{0: >{1}}'.format(x, w)
@@ -103,7 +103,8 @@ class TestTwoPhaseSimplexOffline:
 
     @pytest.mark.parametrize("presolved_solver_and_model, expected, table", [
         (presolve_model_example_solvable(), False, [[0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0], [0.0, 0.0, 1.0, 0.0, -1.0, 0.0, 1.0, 0.0, 101.0], [0.0, 1.0, 0.0, 0.0, -0.19999999999999996, -0.4, 0.19999999999999996, 0.4, 1.8], [0.0, 0.0, 0.0, 1.0, -0.20000000000000018, 0.6000000000000001, 0.20000000000000018, -0.6000000000000001, 0.7999999999999998], [1.0, 0.0, 0.0, 0.0, 0.4, -0.2, -0.4, 0.2, 0.4]]),
-        (presolve_model_example_infeasible(), True, [[0.0, 0.0, 1.0, 1.0, 0.0, -1.0], [1.0, 1.0, 1.0, 0.0, 0.0, 3.0], [0.0, 0.0, -1.0, -1.0, 1.0, 1.0]])
+        (presolve_model_example_infeasible(), True, [[0.0, 0.0, 1.0, 1.0, 0.0, -1.0], [1.0, 1.0, 1.0, 0.0, 0.0, 3.0], [0.0, 0.0, -1.0, -1.0, 1.0, 1.0]]),
+        (presolve_model_example_infeasible(), False, [[0.0, 0.0, 1.0, 1.0, 0.0, -1e-12], [1.0, 1.0, 1.0, 0.0, 0.0, 3.0], [0.0, 0.0, -1.0, -1.0, 1.0, 1e-12]])
     ])
     def test_solver_properly_checking_if_art_vars_positive(self, presolved_solver_and_model, expected, table):
         solver, model = presolved_solver_and_model
@@ -137,4 +138,103 @@ class TestTwoPhaseSimplexOffline:
            f"\n- expected:\n{indented_string(str(expected_restored_table))}" +\
            f"\n- got:\n{indented_string(str(restored_tableau.table))}" +\
            f"\n- input tableau:\n{indented_string(str(tableau))}" +\
-           f"\n- input model:\n{indented_string(str(augmented_model))}"        
\ No newline at end of file
+           f"\n- input model:\n{indented_string(str(augmented_model))}"        
+
+    @pytest.mark.parametrize("model", [
+        model_example_solvable(),
+        model_example_infeasible()
+    ])
+    def test_solver_does_not_modify_original_model(self, model):
+        expected_model = str(model)
+        Solver()._augment_model(model)
+
+        assert str(model) == expected_model, \
+            "augmenting the model should not modify the original one:" +\
+            f"\n- expected:\n{indented_string(expected_model)}" +\
+            f"\n- got:\n{indented_string(str(model))}"
+
+
+    def test_solver_restoring_initial_tableau_keeps_input_intact(self):
+        augmented_model = Solver()._augment_model(model_example_solvable())
+        solver, model = presolve_model_example_solvable()
+        table = np.arange(45, dtype=float).reshape(5, 9)
+        tableau = Tableau(model, table.copy())
+        solver._restore_initial_tableau(tableau, augmented_model)
+
+        assert np.array_equal(tableau.table, table), \
+            "restoring the initial tableau should not modify the input tableau:" +\
+            f"\n- expected:\n{indented_string(str(table))}" +\
+            f"\n- got:\n{indented_string(str(tableau.table))}"
+
+
+    def test_expression_coefficients_sum_duplicated_variables(self):
+        model = Model("duplicated_variables")
+        x1 = model.create_variable("x1")
+        x2 = model.create_variable("x2")
+        expression = 2 * x1 + x2 - 0.5 * x1 + 3 * x2
+        expected = np.array([1.5, 4.0])
+
+        assert np.array_equal(expression.coefficients(model), expected), \
+            "coefficients of the same variable should be summed:" +\
+            f"\n- expected: {expected}" +\
+            f"\n- got: {expression.coefficients(model)}" +\
+            f"\n- for expression: {expression}"
+
+
+    def test_expression_coefficients_follow_model_and_atoms(self):
+        model = Model("coefficients")
+        x1 = model.create_variable("x1")
+        x2 = model.create_variable("x2")
+        expression = 2 * x1 + 3 * x2
+
+        assert np.array_equal(expression.coefficients(model), [2.0, 3.0]), \
+            f"unexpected coefficients: {expression.coefficients(model)}"
+
+        model.create_variable("x3")
+        assert np.array_equal(expression.coefficients(model), [2.0, 3.0, 0.0]), \
+            f"coefficients should cover the newly created variable, got: {expression.coefficients(model)}"
+
+        out = np.full(3, np.nan)
+        result = expression.coefficients(model, out=out)
+        assert result is out and np.array_equal(out, [2.0, 3.0, 0.0]), \
+            f"coefficients should be written into the given buffer, got: {out}"
+
+        expression.atoms = [5 * x1]
+        assert np.array_equal(expression.coefficients(model), [5.0, 0.0, 0.0]), \
+            f"coefficients should reflect the assigned atoms, got: {expression.coefficients(model)}"
+
+
+    def test_solver_finds_optimum_after_restoring_basis(self):
+        # the bounds column must not be mistaken for a basic column when restoring the objective
+        model = Model("example_restored_basis")
+        x1 = model.create_variable("x1")
+        x2 = model.create_variable("x2")
+        model.add_constraint(0.5 * x1 + x2 >= 1)
+        model.add_constraint(-2 * x1 + 2 * x2 >= 2)
+        model.minimize(x2)
+        solution = model.solve()
+
+        assert solution.is_feasible and solution.is_bounded, \
+            f"solver should find an optimal solution for the model:\n{indented_string(str(model))}"
+        assert np.isclose(solution.objective_value(), 1.0), \
+            "solver found incorrect optimum:" +\
+            f"\n- expected: 1.0" +\
+            f"\n- got: {solution.objective_value()}" +\
+            f"\n- for model:\n{indented_string(str(model))}"
+
+
+    def test_solver_objective_row_has_no_negative_zeros(self):
+        # variables absent from the objective should be printed as 0.000, not -0.000
+        model = Model("example_absent_variables")
+        x1 = model.create_variable("x1")
+        x2 = model.create_variable("x2")
+        model.create_variable("x3")
+        model.add_constraint(x1 + x2 <= 4)
+        model.add_constraint(x1 <= 3)
+        model.minimize(2 * x1 + x2)
+        solver = Solver()
+        tableau = solver._basic_initial_tableau(solver._augment_model(model))
+
+        assert not np.signbit(tableau.table[0]).any(), \
+            "objective row should not contain negative zeros:" +\
+            f"\n- got:\n{indented_string(str(tableau.table[0]))}"